@@ -1,5 +1,25 @@
 from scripts.stellar_physics import isothermal_wind_solutions
-from plot_output import plot_solutions, generate_text_files
+from scripts.plot_output import prepare_display_data, plot_solutions, generate_text_files
+
+def run(is_normalized=False, method='RK4'):
+    """
+    Calculates the solutions, generates the text files and plots the solutions, without asking for any input.
+
+    Args:
+        is_normalized: Boolean value that determines whether to use raw or normalized values.
+        method: Name of the numerical method used in the integration (see isothermal_wind_solutions()).
+    """
+    # Calls the main function that calculates the solutions
+    calculated_solutions, Rc_val, a_val = isothermal_wind_solutions(method)
+
+    # Converts the values of the solutions once, for both the text files and the plot
+    display_data = prepare_display_data(calculated_solutions, Rc_val, a_val, is_normalized)
+
+    # Generates the text files for each solution
+    generate_text_files(display_data, is_normalized)
+    
+    # Plots the solutions
+    plot_solutions(display_data, Rc_val, a_val, is_normalized)
 
 if __name__ == "__main__":
     
@@ -9,14 +29,4 @@ if __name__ == "__main__":
             break
         print("Invalid option. Please, type 'Y' or 'N'.")
         
-    is_normalized = normalization_choice == 'Y'
-    
-    # Calls the main function that calculates the solutions
-    calculated_solutions, Rc_val, a_val = isothermal_wind_solutions()
-
-    # Generates the text files for each solution
-    generate_text_files(calculated_solutions, Rc_val, a_val, is_normalized)
-    
-    # Plots the solutions
-    plot_solutions(calculated_solutions, Rc_val, a_val, is_normalized)
-
+    run(normalization_choice == 'Y')
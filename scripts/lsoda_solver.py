@@ -0,0 +1,67 @@
+from functools import lru_cache
+import numpy as np
+from numba import cfunc
+
+@lru_cache
+def make_LSODA_rhs(ODE):
+    """
+    Builds the C callback used by batch_LSODA for a given ODE. numbalsoda calls the right side of the ODE through its address,
+    so the ODE is embedded in a compiled C function. The callback is cached, so it is only compiled once for each ODE.
+
+    Args:
+        ODE: The RIGHT side of the ODE. Called as ODE(x, y). Must be a Numba-compiled (@njit) function.
+
+    Returns:
+        rhs: Numba cfunc with the signature expected by numbalsoda (its address is passed to lsoda).
+    """
+    # numbalsoda compiles its own functions when imported, which takes a few seconds, so it is only imported when this solver is used
+    from numbalsoda import lsoda_sig
+
+    # numbalsoda only integrates forward, so the ODE is written in terms of the distance s from x_initial:
+    # x = x_initial + direction * s and dy/ds = direction * dy/dx, with x_initial and direction passed in "data".
+    @cfunc(lsoda_sig)
+    def rhs(s, y, dy, data):
+        dy[0] = data[1] * ODE(data[0] + data[1] * s, y[0])
+
+    return rhs
+
+def batch_LSODA(ODE, x_values, y_initials):
+    """
+    Integrates several curves of the same ODE over a shared grid of x values, with the adaptive LSODA solver of numbalsoda.
+    The step size is chosen by the solver, so smooth regions take few steps while the region around the critical point takes many.
+    The right side of the ODE is compiled into a C callback, so the integration never goes back to the Python interpreter.
+    The results are sampled over the given grid, like in batch_RK4, so both solvers can be used interchangeably.
+
+    Args:
+        ODE: The RIGHT side of the ODE. Called as ODE(x, y). Must be a Numba-compiled (@njit) function.
+        x_values: Monotonic array with the values of the independent variable where the solution is sampled, shared by every curve
+                  (x_values[0] is the initial value).
+        y_initials: Array with the initial value of the dependent variable of each curve.
+
+    Returns:
+        y_values: NumPy array of shape (number of curves, len(x_values)). Row k holds curve k.
+    """
+    from numbalsoda import lsoda
+    rhs = make_LSODA_rhs(ODE)
+
+    x_initial = x_values[0]
+    direction = np.sign(x_values[-1] - x_initial)
+    s_values = direction * (x_values - x_initial)
+
+    n_curves = len(y_initials)
+    y_values = np.empty((n_curves, len(x_values)))
+
+    for k in range(n_curves):
+        solution, success = lsoda(
+            rhs.address,
+            np.array([y_initials[k]]),
+            s_values,
+            data=np.array([x_initial, direction]),
+            rtol=1e-8,
+            atol=1e-10
+        )
+        if not success:
+            raise RuntimeError(f"LSODA integration of curve {k} failed")
+        y_values[k] = solution[:, 0]
+
+    return y_values
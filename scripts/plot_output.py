@@ -1,11 +1,48 @@
+import numpy as np
 import matplotlib.pyplot as plt
 
-def plot_solutions(solutions, Rc, a, is_normalized):
+def prepare_display_data(solutions, Rc, a, is_normalized):
+    """
+    Converts the values of every solution to the user's preference (normalized or raw values) in a single pass.
+    The result is used both by plot_solutions and by generate_text_files.
+
+    Args:
+        solutions: Dictionary with the data from each solution. (returned by isothermal_wind_solutions())
+        Rc: The critical radius. (returned by isothermal_wind_solutions())
+        a: The isothermal speed of sound. (returned by isothermal_wind_solutions())
+        
+        is_normalized: Boolean value that determines whether to use raw or normalized values. (Returned by user input)
+
+    Returns:
+        display_data: Dictionary with a tuple (r, v) of converted values for each solution.
+    """
+    conversion_factor = 1000.0
+    
+    if is_normalized:                       # normalized values
+        r_divisor, v_divisor = Rc, a
+    else:                                   # raw values converted to km and km/s
+        r_divisor, v_divisor = conversion_factor, conversion_factor
+    
+    display_data = {}
+    source_r = converted_r = None
+    
+    for name, data in solutions.items():
+        # The solutions usually share the same array of r, so it is only converted again when a different array comes up
+        if data['r'] is not source_r:
+            source_r = data['r']
+            converted_r = source_r / r_divisor
+        
+        # Rounds eventual negative values to zero (this occurs as a consequence of the RK4 integration method when computing values near zero)
+        display_data[name] = (converted_r, np.maximum(data['v'], 0.0) / v_divisor)
+    
+    return display_data
+
+def plot_solutions(display_data, Rc, a, is_normalized):
     """
     Plots the solutions using values based on the user's preference (normalized or raw values)
 
     Args:
-        solution: Dictionary with the data from each solution. (returned by isothermal_wind_solutions())
+        display_data: Dictionary with the converted values of each solution. (returned by prepare_display_data())
         Rc: The critical radius. (returned by isothermal_wind_solutions())
         a: The isothermal speed of sound. (returned by isothermal_wind_solutions())
         
@@ -38,29 +75,18 @@ def plot_solutions(solutions, Rc, a, is_normalized):
     }
 
     # Iterates over each solution, picking only the values within the limits determined previously, and plots them.
-    for name, data in solutions.items():
-        if is_normalized:
-            r_data = [r / Rc for r in data['r']]
-            v_data = [v / a for v in data['v']]
-        else:
-            r_data = [r / conversion_factor for r in data['r']]   # raw data converted to km
-            v_data = [v / conversion_factor for v in data['v']]   # raw data converted to km/s
-        
-        clipped_r = []
-        clipped_v = []
-        
-        for r_val, v_val in zip(r_data, v_data):
-            # The condition below selects only the values within the limits
-            if x_min <= r_val <= x_max and y_min <= v_val <= y_max:
-                clipped_r.append(r_val)
-                clipped_v.append(v_val)
+    for name, (r_data, v_data) in display_data.items():
+        # The mask below selects only the values within the limits
+        within_limits = (r_data >= x_min) & (r_data <= x_max) & (v_data >= y_min) & (v_data <= y_max)
         
+        # rasterized=True keeps vector outputs (PDF, SVG) from storing every point as a separate vector marker
         plt.plot(
-            clipped_r, 
-            clipped_v, 
+            r_data[within_limits], 
+            v_data[within_limits], 
             plot_styles[name]['color'] + '.', 
             markersize='1.1', 
-            label=plot_styles[name]['label']
+            label=plot_styles[name]['label'], 
+            rasterized=True
         )
     
     # Draws a marker over the sonic point (1,1) along with a textual indication
@@ -80,49 +106,26 @@ def plot_solutions(solutions, Rc, a, is_normalized):
     plt.ylabel(y_label)
     plt.grid(True)
     plt.legend(markerscale=10)
-    plt.savefig("isothermal_wind_solutions.png", format="png")
+    plt.savefig("isothermal_wind_solutions.png", format="png", dpi=100)
     plt.show()
 
-def generate_text_files(solutions, Rc, a, is_normalized):
+def generate_text_files(display_data, is_normalized):
     """
     Generates a separate text file with the values of "r" and "v" for each solution.
     
     Args:
-        solution: Dictionary with the data from each solution. (returned by isothermal_wind_solutions())
-        Rc: The critical radius. (returned by isothermal_wind_solutions())
-        a: The isothermal speed of sound. (returned by isothermal_wind_solutions())
+        display_data: Dictionary with the converted values of each solution. (returned by prepare_display_data())
         
         is_normalized: Boolean value that determines whether to use raw or normalized values. (Returned by user input)
     """
-    conversion_factor = 1000.0
+    if is_normalized:                       # normalized values
+        header = "r/R_c v/a"                # column headers (normalized)
+    else:                                   # raw values converted to km and km/s
+        header = "r(km) v(km/s)"            # column headers (raw)
     
-    for name, data in solutions.items():
+    for name, (r_data, v_data) in display_data.items():
         filename = f"{name.replace(' ', '_').replace('->', 'to')}.txt"
-        with open(filename, 'w') as f:
-            if is_normalized:                       # normalized values
-                f.write("r/R_c v/a\n")            # writes the column headers (normalized)
-                # Normalizes the values before writing them to the files
-                normalized_r = [r / Rc for r in data['r']]
-                normalized_v = [v / a for v in data['v']]
-                
-                # Rounds eventual negative values to zero (this occurs as a consequence of the RK4 integration method when computing values near zero)
-                for i in range(len(normalized_v)):
-                    if normalized_v[i] < 0:
-                        normalized_v[i] = 0.0
-
-                # Writes the normalized values to two separate columns in the text file
-                for r_val, v_val in zip(normalized_r, normalized_v):
-                    f.write(f"{r_val:.6e} {v_val:.6e}\n")
-            else:
-                f.write("r(km) v(km/s)\n")               # writes the column headers (raw)
-                
-                # Rounds eventual negative values to zero (this occurs as a consequence of the RK4 integration method when computing values near zero)
-                v_raw = list(data['v']) # Create a mutable copy
-                for i in range(len(v_raw)):
-                    if v_raw[i] < 0:
-                        v_raw[i] = 0.0
-                        
-                # Writes the raw values to two separate columns in the text file
-                for r_val, v_val in zip(data['r'], v_raw):
-                    f.write(f"{r_val / conversion_factor:.6e} {v_val / conversion_factor:.6e}\n")
+        
+        # Writes the values to two separate columns in the text file
+        np.savetxt(filename, np.column_stack((r_data, v_data)), fmt='%.6e', header=header, comments='')
         print(f"Solution data '{name}' saved to '{filename}'")
\ No newline at end of file
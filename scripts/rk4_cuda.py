@@ -0,0 +1,67 @@
+from functools import lru_cache
+import numpy as np
+from numba import cuda
+
+@lru_cache
+def make_RK4_kernel(ODE):
+    """
+    Builds the CUDA kernel used by batch_RK4_cuda for a given ODE. CUDA kernels cannot receive functions as arguments,
+    so the ODE is embedded in the kernel. The kernel is cached, so it is only compiled once for each ODE.
+
+    Args:
+        ODE: The RIGHT side of the ODE. Called as ODE(x, y). Must be a Numba-compiled (@njit) function.
+
+    Returns:
+        RK4_kernel: CUDA kernel that integrates one curve per thread.
+    """
+    @cuda.jit
+    def RK4_kernel(x_values, y_initials, y_values):
+        k = cuda.grid(1)    # Index of the curve integrated by this thread
+        if k >= y_initials.size:
+            return
+
+        # The current value of y is kept in a register, the array in device memory is only written
+        current_y = y_initials[k]
+        y_values[k, 0] = current_y
+
+        for i in range(x_values.size - 1):
+            # The step is the same for every curve (and every thread)
+            x = x_values[i]
+            h = x_values[i + 1] - x
+
+            k1 = h * ODE(x, current_y)
+            k2 = h * ODE(x + 0.5 * h, current_y + 0.5 * k1)
+            k3 = h * ODE(x + 0.5 * h, current_y + 0.5 * k2)
+            k4 = h * ODE(x + h, current_y + k3)
+
+            current_y = current_y + (k1 + 2 * k2 + 2 * k3 + k4) / 6
+            y_values[k, i + 1] = current_y
+
+    return RK4_kernel
+
+def batch_RK4_cuda(ODE, x_values, y_initials):
+    """
+    Integrates several curves of the same ODE at once on the GPU over a shared grid of x values, with the fourth order Runge-Kutta method.
+    Each curve is integrated by its own CUDA thread. Requires a CUDA capable GPU.
+    With only a few curves the GPU is mostly idle, but the cost barely grows when many more initial conditions are integrated.
+
+    Args:
+        ODE: The RIGHT side of the ODE. Called as ODE(x, y). Must be a Numba-compiled (@njit) function.
+        x_values: Array with the values of the independent variable at each step, shared by every curve (x_values[0] is the initial value).
+        y_initials: Array with the initial value of the dependent variable of each curve.
+
+    Returns:
+        y_values: NumPy array of shape (number of curves, len(x_values)). Row k holds curve k.
+    """
+    n_curves = len(y_initials)
+    y_values = cuda.device_array((n_curves, len(x_values)))
+
+    threads_per_block = 32
+    blocks = (n_curves + threads_per_block - 1) // threads_per_block
+    make_RK4_kernel(ODE)[blocks, threads_per_block](
+        cuda.to_device(np.asarray(x_values, dtype=np.float64)),
+        cuda.to_device(np.asarray(y_initials, dtype=np.float64)),
+        y_values
+    )
+
+    return y_values.copy_to_host()
@@ -1,32 +1,60 @@
-def RK4(ODE, x_initial, y_initial, x_final, n):
+import numpy as np
+from numba import njit
+
+@njit(fastmath=True, boundscheck=False)
+def batch_RK4(ODE, x_values, y_initials):
+    """
+    Integrates several curves of the same ODE at once over a shared grid of x values, with the fourth order Runge-Kutta method.
+    The curves advance together, one step at a time: the current value of y of every curve is kept in a small array that stays in cache,
+    and the independent updates of the different curves can be vectorized by the compiler.
+
+    Args:
+        ODE: The RIGHT side of the ODE. Called as ODE(x, y).
+        x_values: Array with the values of the independent variable at each step, shared by every curve (x_values[0] is the initial value).
+        y_initials: Array with the initial value of the dependent variable of each curve.
+
+    Returns:
+        y_values: NumPy array of shape (number of curves, len(x_values)). Row k holds curve k.
+    """
+    n_curves = y_initials.size
+    n = x_values.size - 1
+    y_values = np.empty((n_curves, n + 1))
+
+    # Current value of y of each curve
+    current_y = y_initials.astype(np.float64)
+    y_values[:, 0] = current_y
+
+    for i in range(n):
+        # The step is the same for every curve
+        x = x_values[i]
+        h = x_values[i + 1] - x
+
+        for k in range(n_curves):
+
+            y = current_y[k]
+
+            k1 = h * ODE(x, y)
+            k2 = h * ODE(x + 0.5 * h, y + 0.5 * k1)
+            k3 = h * ODE(x + 0.5 * h, y + 0.5 * k2)
+            k4 = h * ODE(x + h, y + k3)
+
+            current_y[k] = y + (k1 + 2 * k2 + 2 * k3 + k4) / 6
+            y_values[k, i + 1] = current_y[k]
+
+    return y_values
+
+@njit(fastmath=True)
+def RK4(ODE, x_values, y_initial):
     """
-    Fourth order Runge-Kutta solver for ODEs.
-    It calculates the next step in a curve based on the current and previous values of the slope.
+    Fourth order Runge-Kutta solver for a single curve of an ODE, over a given grid of x values.
+    Compiled with Numba, so ODE must also be a Numba-compiled (@njit) function. It is a single curve version of batch_RK4.
 
     Args:
-        ODE: The RIGHT side of the ODE.
-        x_initial: Initial value of the independent variable.
+        ODE: The RIGHT side of the ODE. Called as ODE(x, y).
+        x_values: Array with the values of the independent variable at each step (x_values[0] is the initial value).
         y_initial: Initial value of the dependent variable.
-        x_final: Final value of the independent variable.
-        n (int): The number of steps to be used in the numerical integration.
 
+    Returns:
+        y_values: NumPy array with the values of the dependent variable at each value of x_values.
     """
-    x_values = [x_initial]
-    y_values = [y_initial]
-    h = (x_final - x_initial) / n
-
-    for _ in range(n):
-
-        current_x = x_values[-1]    # Attributes the last value in x_values to current_x
-        current_y = y_values[-1]    # Attributes the last value in y_values to current_y
-
-        k1 = h * ODE(current_x, current_y)
-        k2 = h * ODE(current_x + 0.5 * h, current_y + 0.5 * k1)
-        k3 = h * ODE(current_x + 0.5 * h, current_y + 0.5 * k2)
-        k4 = h * ODE(current_x + h, current_y + k3)
-        
-        # Attributes the newfound values of x and y to x_values and y_values, respectively
-        y_values.append(current_y + (k1 + 2 * k2 + 2 * k3 + k4) / 6)
-        x_values.append(current_x + h)
-        
-    return x_values, y_values
\ No newline at end of file
+    return batch_RK4(ODE, x_values, np.array([y_initial], dtype=np.float64))[0]
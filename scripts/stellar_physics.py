@@ -1,15 +1,80 @@
 from math import sqrt
-from .rk4_solver import RK4
+from functools import lru_cache
+import numpy as np
 
-def isothermal_wind_solutions():
+# Adapters that give every solver the same interface: the grid of r, the initial velocities and the constants a**2, 2 * a**2 and G * M.
+# The solvers are only imported when used: the CUDA solver requires a CUDA capable GPU, and the Cython solver must be compiled first
+# but does not depend on Numba, which is only imported by the other solvers.
+
+def _rk4_solver(x_values, y_initials, a2, two_a2, GM):
+    from .rk4_solver import batch_RK4
+    return batch_RK4(make_solar_wind_ode(a2, two_a2, GM), x_values, y_initials)
+
+def _lsoda_solver(x_values, y_initials, a2, two_a2, GM):
+    from .lsoda_solver import batch_LSODA
+    return batch_LSODA(make_solar_wind_ode(a2, two_a2, GM), x_values, y_initials)
+
+def _cuda_solver(x_values, y_initials, a2, two_a2, GM):
+    from .rk4_cuda import batch_RK4_cuda
+    return batch_RK4_cuda(make_solar_wind_ode(a2, two_a2, GM), x_values, y_initials)
+
+def _cython_solver(x_values, y_initials, a2, two_a2, GM):
+    # The Cython solver has the momentum equation built in, so it receives the constants instead of a compiled ODE
+    from .rk4_cython import batch_RK4_wind
+    return batch_RK4_wind(x_values, y_initials, a2, two_a2, GM)
+
+# Numerical methods available to isothermal_wind_solutions. All of them take the same arguments and return the same arrays.
+solvers = {
+    'RK4': _rk4_solver,         # Fixed step fourth order Runge-Kutta
+    'LSODA': _lsoda_solver,     # Adaptive step LSODA (numbalsoda)
+    'CUDA': _cuda_solver,       # Fixed step fourth order Runge-Kutta on the GPU
+    'Cython': _cython_solver    # Fixed step fourth order Runge-Kutta compiled ahead of time with Cython
+}
+
+@lru_cache
+def make_solar_wind_ode(a2, two_a2, GM):
+    """
+    Builds the right side of the momentum equation of an isothermal wind. Will be used as the "ODE" arg in the solver functions.
+    The constants are embedded in the compiled function, so Numba generates a version specialized for them.
+    The function is cached, so calls with the same constants reuse the same compiled ODE (and the solvers compiled for it).
+
+    Args:
+        a2: a**2, the squared isothermal speed of sound.
+        two_a2: 2 * a**2.
+        GM: G * M, the gravitational constant times the mass of the star.
+
+    Returns:
+        solar_wind_ode: Numba-compiled function of (r, v).
+    """
+    # Imported here, so that the Cython solver can be used without Numba
+    from numba import njit
+
+    @njit(fastmath=True)
+    def solar_wind_ode(r, v):
+        numerator = v * (two_a2 / r - GM / (r * r))
+        denominator = v * v - a2
+
+        # This avoids the case in which the denominator is infinitesimally close to 0 without branching:
+        # it is equal to numerator / denominator unless the denominator is close to 0, in which case it goes to 0.
+        return numerator * denominator / (denominator * denominator + 1e-24)
+
+    return solar_wind_ode
+
+def isothermal_wind_solutions(method='RK4'):
     """
-    Utilizes the RK4 script to calculate different solutions to the momentum equation of an isothermal wind.
+    Utilizes one of the solvers (RK4, LSODA, CUDA or Cython) to calculate different solutions to the momentum equation of an isothermal wind.
+
+    Args:
+        method: Name of the numerical method used in the integration, 'RK4' (default), 'LSODA', 'CUDA' or 'Cython'.
 
     Returns:
         solutions: A dictionary with the solutions for each curve (two columns with coordinates for r and v)
         Rc: The critical radius.
         a: The isothermal speed of sound.
     """
+    if method not in solvers:
+        raise ValueError(f"Unknown method '{method}'. Available methods: {', '.join(solvers)}")
+    
     # Physical constants of the Sun in the International System
     G = 6.674e-11   # Gravitational constant (m3 kg-1 s-2)
     M = 1.989e30    # Mass of the star (kg)
@@ -28,63 +93,52 @@ def isothermal_wind_solutions():
     # Calculated values
     a = sqrt((R * T) / molar_mass_u)    # Isothermal speed of sound
     Rc = (G * M) / (2 * (a**2))     # Critical radius
-    n = 50000       # number of steps to be used as an arg in the function RK4
-    x_final = 5 * Rc      # Final value of the independent variable to be used as an arg in the function RK4
+    n = 50000       # number of steps of each branch of the solutions
+    x_final = 5 * Rc      # Final value of the independent variable
 
-    # The right side of the momentum equation of an isothermal wind. Will be used as the "ODE" arg in the RK4 function
-    def solar_wind_ode(r, v):
-        numerator = v * ((2 * a**2) / r - (G * M) / r**2)
-        denominator = v**2 - a**2
-        
-        # This avoids the case in which the denominator is infinitesimally close to 0.
-        if abs(denominator) < 1e-12:
-            return 0.0
-        return numerator / denominator
+    # Constants of the momentum equation, computed once
+    a2 = a * a
+    two_a2 = 2.0 * a2
+    GM = G * M
 
-    solutions = {}
-    
-    # Transonic Solutions
-    
-    # Transonic wind solution (subsonic start)
-    r_tsonic_sub_inward, v_tsonic_sub_inward = RK4(solar_wind_ode, Rc, a * (1 - 1e-6), R0, n)
-    r_tsonic_sub_inward.reverse(); v_tsonic_sub_inward.reverse()
-    r_tsonic_sub_outward, v_tsonic_sub_outward = RK4(solar_wind_ode, Rc, a * (1 + 1e-6), x_final, n)
-    solutions['Transonic subsonic'] = {'r': r_tsonic_sub_inward[:-1] + r_tsonic_sub_outward, 'v': v_tsonic_sub_inward[:-1] + v_tsonic_sub_outward}
-
-    # Transonic wind solution (supersonic start)
-    r_tsonic_sup_inward, v_tsonic_sup_inward = RK4(solar_wind_ode, Rc, a * (1 + 1e-6), R0, n)
-    r_tsonic_sup_inward.reverse(); v_tsonic_sup_inward.reverse()
-    r_tsonic_sup_outward, v_tsonic_sup_outward = RK4(solar_wind_ode, Rc, a * (1 - 1e-6), x_final, n)
-    solutions['Transonic supersonic'] = {'r': r_tsonic_sup_inward[:-1] + r_tsonic_sup_outward, 'v': v_tsonic_sup_inward[:-1] + v_tsonic_sup_outward}
+    # Initial velocities (at r = Rc) of the inward (from Rc to R0) and outward (from Rc to x_final) branches of each solution
+    initial_velocities = {
+        # Transonic Solutions
+        'Transonic subsonic': (a * (1 - 1e-6), a * (1 + 1e-6)),       # Transonic wind solution (subsonic start)
+        'Transonic supersonic': (a * (1 + 1e-6), a * (1 - 1e-6)),     # Transonic wind solution (supersonic start)
 
-    
-    # Non-transonic solutions
+        # Non-transonic solutions
 
-    # Subsonic solutions
-    
-    r_ntsonic_sub_inward, v_ntsonic_sub_inward = RK4(solar_wind_ode, Rc, a * 0.75, R0, n)
-    r_ntsonic_sub_inward.reverse(); v_ntsonic_sub_inward.reverse()
-    r_ntsonic_sub_outward, v_ntsonic_sub_outward = RK4(solar_wind_ode, Rc, a * 0.75, x_final, n)
-    solutions['Non-transonic subsonic solution I'] = {'r': r_ntsonic_sub_inward[:-1] + r_ntsonic_sub_outward, 'v': v_ntsonic_sub_inward[:-1] + v_ntsonic_sub_outward}
+        # Subsonic solutions
+        'Non-transonic subsonic solution I': (a * 0.75, a * 0.75),
+        'Non-transonic subsonic solution II': (a * 0.4, a * 0.4),
 
-    r_ntsonic_sub_inward_2, v_ntsonic_sub_inward_2 = RK4(solar_wind_ode, Rc, a * 0.4, R0, n)
-    r_ntsonic_sub_inward_2.reverse(); v_ntsonic_sub_inward_2.reverse()
-    r_ntsonic_sub_outward_2, v_ntsonic_sub_outward_2 = RK4(solar_wind_ode, Rc, a * 0.4, x_final, n)
-    solutions['Non-transonic subsonic solution II'] = {'r': r_ntsonic_sub_inward_2[:-1] + r_ntsonic_sub_outward_2, 'v': v_ntsonic_sub_inward_2[:-1] + v_ntsonic_sub_outward_2}
+        # Supersonic solutions
+        'Non-transonic supersonic solution I': (a * 1.25, a * 1.25),
+        'Non-transonic supersonic solution II': (a * 1.6, a * 1.6)
+    }
+
+    # Grids of r shared by the inward (from Rc to R0) and the outward (from Rc to x_final) branches of every solution
+    r_inward = np.linspace(Rc, R0, n + 1)
+    r_outward = np.linspace(Rc, x_final, n + 1)
+
+    # The inward branches of every solution are integrated in a single call, and so are the outward branches (one row per solution)
+    v_initials_inward = np.array([v_branches[0] for v_branches in initial_velocities.values()])
+    v_initials_outward = np.array([v_branches[1] for v_branches in initial_velocities.values()])
+    v_inward = solvers[method](r_inward, v_initials_inward, a2, two_a2, GM)
+    v_outward = solvers[method](r_outward, v_initials_outward, a2, two_a2, GM)
+
+    # Joins the branches of every solution at once, so that r increases along each row: the inward branches are reversed
+    # with a stride-reversing view that also drops their last point (r = Rc, which is the first point of the outward branch)
+    r_joined = np.concatenate((r_inward[:0:-1], r_outward))
+    v_joined = np.concatenate((v_inward[:, :0:-1], v_outward), axis=1)
+
+    solutions = {}
+
+    # Every solution shares the same array of r
+    for i, name in enumerate(initial_velocities):
+        solutions[name] = {'r': r_joined, 'v': v_joined[i]}
 
-    
-    # Supersonic solutions
-    
-    r_ntsonic_sup_inward, v_ntsonic_sup_inward = RK4(solar_wind_ode, Rc, a * 1.25, R0, n)
-    r_ntsonic_sup_inward.reverse(); v_ntsonic_sup_inward.reverse()
-    r_ntsonic_sup_outward, v_ntsonic_sup_outward = RK4(solar_wind_ode, Rc, a * 1.25, x_final, n)
-    solutions['Non-transonic supersonic solution I'] = {'r': r_ntsonic_sup_inward[:-1] + r_ntsonic_sup_outward, 'v': v_ntsonic_sup_inward[:-1] + v_ntsonic_sup_outward}
-
-    r_ntsonic_sup_inward_2, v_ntsonic_sup_inward_2 = RK4(solar_wind_ode, Rc, a * 1.6, R0, n)
-    r_ntsonic_sup_inward_2.reverse(); v_ntsonic_sup_inward_2.reverse()
-    r_ntsonic_sup_outward_2, v_ntsonic_sup_outward_2 = RK4(solar_wind_ode, Rc, a * 1.6, x_final, n)
-    solutions['Non-transonic supersonic solution II'] = {'r': r_ntsonic_sup_inward_2[:-1] + r_ntsonic_sup_outward_2, 'v': v_ntsonic_sup_inward_2[:-1] + v_ntsonic_sup_outward_2}
-      
     print(f"Stellar radius (R0): {R0/conversion_factor:.2e} km")
     print(f"Isothermal speed of sound (a): {a/conversion_factor:.2e} km/s")
     print(f"Critical Radius (Rc): {Rc/conversion_factor:.2e} km")
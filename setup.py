@@ -0,0 +1,38 @@
+import sys
+from setuptools import setup, Extension
+from setuptools.command.build_ext import build_ext
+from Cython.Build import cythonize
+
+# Builds the optional Cython solver (scripts/rk4_cython.pyx). Run with:
+#     python setup.py build_ext --inplace
+extensions = [
+    Extension(
+        'scripts.rk4_cython',
+        ['scripts/rk4_cython.pyx']
+    )
+]
+
+class OpenMPBuildExt(build_ext):
+    """
+    Adds the OpenMP flags of the compiler being used, so the curves are integrated in parallel.
+    Apple clang does not ship OpenMP, so on macOS the extension is built without it and the curves are integrated one after the other.
+    """
+    def build_extensions(self):
+        if self.compiler.compiler_type == 'msvc':
+            compile_args, link_args = ['/O2', '/openmp'], []
+        elif sys.platform == 'darwin':
+            compile_args, link_args = ['-O3'], []
+        else:
+            compile_args, link_args = ['-O3', '-fopenmp'], ['-fopenmp']
+
+        for extension in self.extensions:
+            extension.extra_compile_args = compile_args
+            extension.extra_link_args = link_args
+
+        super().build_extensions()
+
+setup(
+    name='rk4-wind-solution',
+    ext_modules=cythonize(extensions, language_level=3),
+    cmdclass={'build_ext': OpenMPBuildExt}
+)